@@ -4,14 +4,23 @@ generating AI suggestions.
 """
 
 from typing import Optional, List
+import hashlib
 import os
 import logging
+import threading
+import time
 
 import fastapi
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi import Depends, BackgroundTasks, HTTPException
+import diskcache
+import orjson
 import pydantic
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 import ticket_manager
 import llm_integration
@@ -29,13 +38,35 @@ app.add_middleware(
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["GET", "POST"],
-    allow_headers=["*"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Constants for column names
 COLUMN_TICKET_ID = "ticket_id"
 COLUMN_RESOLVED = "resolved"
-COLUMN_TEXT = "text"
+
+# Resolved tickets are persisted as a directory of Parquet parts, one per
+# save; the CSV is only read to migrate data written by earlier versions.
+# A full rewrite writes a "base" part that supersedes every older part.
+RESOLVED_TICKETS_DIR = "ai_resolved"
+LEGACY_RESOLVED_TICKETS_PATH = "ai_resolved.csv"
+RESOLVED_TICKETS_SCHEMA = pa.schema(
+    [
+        (COLUMN_TICKET_ID, pa.string()),
+        ("issue", pa.string()),
+        ("description", pa.string()),
+        ("resolution", pa.string()),
+        (COLUMN_RESOLVED, pa.bool_()),
+        ("agent_name", pa.string()),
+        ("ai_suggestion_helpful", pa.bool_()),
+        ("feedback", pa.string()),
+    ]
+)
+
+
+def _part_timestamp(part_name: str) -> int:
+    """Write timestamp encoded in a resolved tickets part name."""
+    return int(part_name.split("-", 1)[1].split(".", 1)[0])
 
 
 # Dependency for ticket services and loading resolved tickets
@@ -44,48 +75,220 @@ class TicketService:
 
     def __init__(self):
         """Initialize TicketService with resolved tickets data."""
+        # Guards mutations of resolved_tickets_df; the service is shared
+        # across requests and sync endpoints run in a threadpool.
+        self.lock = threading.RLock()
+        # Serializes disk writes, which run outside self.lock so a slow
+        # save never blocks resolves on the event loop
+        self._write_lock = threading.Lock()
+        # Resolved tickets not yet concatenated onto the DataFrame
+        self._pending: list[dict] = []
+        # Resolved tickets not yet written to disk
+        self._dirty_rows: list[dict] = []
+        # JSON body served by /resolved-tickets, reset on mutation
+        self._records_json: Optional[bytes] = None
         try:
-            if os.path.exists("ai_resolved.csv"):
-                self.resolved_tickets_df = pd.read_csv("ai_resolved.csv")
-            else:
-                self.resolved_tickets_df = pd.DataFrame(
-                    columns=[
-                        COLUMN_TICKET_ID,
-                        "issue",
-                        "description",
-                        "resolution",
-                        COLUMN_RESOLVED,
-                        "agent_name",
-                        "ai_suggestion_helpful",
-                        "feedback",
+            parts = self._live_parts()
+            if parts:
+                # Parquet keeps the column dtypes, no fix-up needed
+                self.resolved_tickets_df = pa.concat_tables(
+                    [
+                        pq.read_table(os.path.join(RESOLVED_TICKETS_DIR, part))
+                        for part in parts
                     ]
-                )
-            # Ensure the resolved field is always boolean
-            self.resolved_tickets_df[COLUMN_RESOLVED] = (
-                self.resolved_tickets_df[COLUMN_RESOLVED]
-                .fillna(False)
-                .astype(bool)
-            )
+                ).to_pandas()
+                self._rewrite = False
+                # Each save adds a part; merge them so startup reads one file
+                if len(parts) > 1:
+                    self._write_part(self.resolved_tickets_df, replace=True)
+            else:
+                self.resolved_tickets_df = self._load_legacy()
+                # Ensure the resolved field is always boolean
+                resolved = self.resolved_tickets_df[COLUMN_RESOLVED]
+                if resolved.dtype != bool:
+                    self.resolved_tickets_df[COLUMN_RESOLVED] = (
+                        resolved.fillna(False).astype(bool)
+                    )
         except Exception as init_err:
             logger.error("Error initializing TicketService: %s", init_err)
             raise HTTPException(
                 status_code=500, detail="Failed to initialize ticket service"
             ) from init_err
 
-    def save_to_csv(self):
-        """Save resolved tickets to CSV file."""
+    @property
+    def resolved_tickets_df(self) -> pd.DataFrame:
+        """Resolved tickets, including any still buffered."""
+        with self.lock:
+            if self._pending:
+                self._resolved_tickets_df = pd.concat(
+                    [self._resolved_tickets_df, pd.DataFrame(self._pending)],
+                    ignore_index=True,
+                )
+                self._pending.clear()
+            return self._resolved_tickets_df
+
+    @resolved_tickets_df.setter
+    def resolved_tickets_df(self, df: pd.DataFrame):
+        with self.lock:
+            self._pending.clear()
+            self._dirty_rows.clear()
+            self._resolved_tickets_df = df
+            self._records_json = None
+            # Replacing the frame can drop rows, so the next save rewrites
+            self._rewrite = True
+
+    def add_resolved_ticket(self, resolved_ticket: dict):
+        """
+        Buffer a resolved ticket; it is merged into the DataFrame on the next
+        read or save instead of copying the whole frame per ticket.
+
+        :param resolved_ticket: The resolved ticket as a dict.
+        """
+        with self.lock:
+            self._pending.append(resolved_ticket)
+            self._dirty_rows.append(resolved_ticket)
+            self._records_json = None
+
+    def get_records_json(self) -> bytes:
+        """
+        Resolved tickets serialized as a JSON array of records. The tickets
+        go through an Arrow table straight to orjson, with missing text
+        replaced by "N/A", once per change rather than on every request.
+
+        :return: The JSON-encoded resolved tickets.
+        """
+        with self.lock:
+            if self._records_json is not None:
+                return self._records_json
+            # Frames are replaced, never mutated, so serialize a reference
+            # outside the lock
+            df = self.resolved_tickets_df
+        table = pa.Table.from_pandas(
+            df, schema=RESOLVED_TICKETS_SCHEMA, preserve_index=False
+        )
+        columns = [
+            (
+                pc.fill_null(column, "N/A")
+                if pa.types.is_string(column.type)
+                else column
+            )
+            for column in table.columns
+        ]
+        table = pa.Table.from_arrays(columns, schema=table.schema)
+        records_json = orjson.dumps(table.to_pylist())
+        with self.lock:
+            # Only cache the body if no ticket changed in the meantime
+            if self._resolved_tickets_df is df and not self._pending:
+                self._records_json = records_json
+        return records_json
+
+    def _load_legacy(self) -> pd.DataFrame:
+        """Load resolved tickets from the legacy CSV file, if present."""
+        if os.path.exists(LEGACY_RESOLVED_TICKETS_PATH):
+            return pd.read_csv(
+                LEGACY_RESOLVED_TICKETS_PATH,
+                usecols=lambda column: column in RESOLVED_TICKETS_SCHEMA.names,
+            )
+        return pd.DataFrame(columns=RESOLVED_TICKETS_SCHEMA.names)
+
+    @staticmethod
+    def _live_parts() -> list[str]:
+        """
+        Names of the Parquet parts that make up the resolved tickets, in
+        write order: the newest base part and every part written after it.
+        Older parts are superseded, and "_" names are unfinished writes.
+        """
+        if not os.path.isdir(RESOLVED_TICKETS_DIR):
+            return []
+        parts = sorted(
+            (
+                name
+                for name in os.listdir(RESOLVED_TICKETS_DIR)
+                if name.endswith(".parquet") and not name.startswith("_")
+            ),
+            key=_part_timestamp,
+        )
+        bases = [name for name in parts if name.startswith("base-")]
+        if bases:
+            parts = parts[parts.index(bases[-1]):]
+        return parts
+
+    def _write_part(self, df: pd.DataFrame, replace: bool = False):
+        """
+        Write a DataFrame as a new Parquet part of the resolved tickets.
+
+        :param df: The resolved tickets to write.
+        :param replace: Whether the part replaces all previously written
+            parts. It is written as a base part, so readers ignore the old
+            parts even if removing them is interrupted.
+        """
+        os.makedirs(RESOLVED_TICKETS_DIR, exist_ok=True)
+        old_parts = os.listdir(RESOLVED_TICKETS_DIR) if replace else []
+        # Zero-padded timestamps keep parts in write order when read back
+        prefix = "base" if replace else "part"
+        part_name = f"{prefix}-{time.time_ns():020d}.parquet"
+        # Write under a "_" name, which readers skip, then rename atomically
+        tmp_path = os.path.join(RESOLVED_TICKETS_DIR, f"_{part_name}")
+        table = pa.Table.from_pandas(
+            df, schema=RESOLVED_TICKETS_SCHEMA, preserve_index=False
+        )
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, os.path.join(RESOLVED_TICKETS_DIR, part_name))
+        for old_part in old_parts:
+            os.remove(os.path.join(RESOLVED_TICKETS_DIR, old_part))
+
+    def save_to_parquet(self):
+        """
+        Save resolved tickets to Parquet. Only tickets resolved since the
+        last save are appended, unless rows were removed, which requires a
+        full rewrite. The data is taken under the lock and written outside
+        it.
+        """
         try:
-            self.resolved_tickets_df.to_csv("ai_resolved.csv", index=False)
+            with self._write_lock:
+                with self.lock:
+                    replace = self._rewrite
+                    # Frames are replaced, never mutated, so a reference
+                    # is a consistent snapshot
+                    df = self.resolved_tickets_df if replace else None
+                    rows = self._dirty_rows
+                    self._dirty_rows = []
+                    self._rewrite = False
+                try:
+                    if replace:
+                        self._write_part(df, replace=True)
+                    elif rows:
+                        self._write_part(pd.DataFrame(rows))
+                except Exception:
+                    # Keep the unsaved changes for the next save
+                    with self.lock:
+                        if replace:
+                            self._rewrite = True
+                        elif not self._rewrite:
+                            self._dirty_rows[:0] = rows
+                    raise
         except Exception as save_err:
-            logger.error("Error saving resolved tickets to CSV: %s", save_err)
+            logger.error(
+                "Error saving resolved tickets to Parquet: %s", save_err
+            )
             raise HTTPException(
                 status_code=500, detail="Failed to save resolved tickets"
             ) from save_err
 
 
+_ticket_service: Optional[TicketService] = None
+_ticket_service_lock = threading.Lock()
+
+
 def get_ticket_service() -> TicketService:
-    """Dependency injection for TicketService."""
-    return TicketService()
+    """Dependency injection for TicketService, shared across requests."""
+    global _ticket_service
+    if _ticket_service is None:
+        # Concurrent first requests must not each build their own service
+        with _ticket_service_lock:
+            if _ticket_service is None:
+                _ticket_service = TicketService()
+    return _ticket_service
 
 
 # Initialize the DataLoader and other components
@@ -97,13 +300,21 @@ OLD_TICKETS_PATHS = [
 ]
 
 new_ticket_loader = data_loader.DataLoader([NEW_TICKET_PATH])
-old_ticket_loader = data_loader.DataLoader(OLD_TICKETS_PATHS)
+# Old tickets only feed the similarity engine, so load just what it uses
+old_ticket_loader = data_loader.DataLoader(
+    OLD_TICKETS_PATHS,
+    columns=["ticket_id", "issue", "description", "resolution", "resolved"],
+)
 
-NewTicketManager = ticket_manager.TicketManager(new_ticket_loader.load_data())
+NewTicketManager = ticket_manager.TicketManager(
+    new_ticket_loader.load_data(), resolvable=True
+)
 OldTicketsManager = ticket_manager.TicketManager(old_ticket_loader.load_data())
 
 similarity_engine = similarity.SimilarityEngine(OldTicketsManager.tickets_df)
 ai_suggestion_engine = llm_integration.AISuggestionEngine()
+# AI suggestions keyed by ticket content, persisted across restarts
+suggestion_cache = diskcache.Cache("ai_suggestions_cache")
 
 
 class ResolveTicketInput(pydantic.BaseModel):
@@ -124,11 +335,19 @@ def read_root():
     return {"message": "Welcome to the IT Helpdesk Ticket Resolution System"}
 
 
-@app.get("/all-tickets", response_model=List[ticket_manager.Ticket])
+@app.get(
+    "/all-tickets",
+    response_model=List[ticket_manager.Ticket],
+    response_class=ORJSONResponse,
+)
 def get_all_tickets():
-    """Fetch all tickets."""
+    """
+    Fetch all tickets. The tickets are serialized directly, skipping
+    FastAPI's re-validation of each item against the response model.
+    """
     try:
-        return NewTicketManager.get_all_tickets()
+        tickets = NewTicketManager.get_all_tickets()
+        return ORJSONResponse([ticket.model_dump() for ticket in tickets])
     except Exception as all_tickets_err:
         logger.error("Error fetching all tickets: %s", all_tickets_err)
         raise HTTPException(
@@ -157,19 +376,39 @@ def get_ticket(ticket_idx: int):
 @app.post("/ai-suggestion")
 def get_ai_suggestion(ticket: ticket_manager.Ticket):
     """
-    Provides an AI-generated suggestion for the given ticket.
+    Provides an AI-generated suggestion for the given ticket. Suggestions
+    are cached by the ticket text, the similar tickets found for it and the
+    provider, model and prompt version that generate it.
     """
     try:
         similar_tickets = similarity_engine.find_similar_tickets(
             f"{ticket.issue} {ticket.description}"
         )
+        cache_key = hashlib.sha256(
+            "\n".join(
+                [
+                    ai_suggestion_engine.provider,
+                    ai_suggestion_engine.model,
+                    str(llm_integration.PROMPT_VERSION),
+                    ticket.issue,
+                    ticket.description,
+                    *similar_tickets.ticket_id,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        cached = suggestion_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         suggestion = ai_suggestion_engine.generate_suggestion(
-            similar_tickets, ticket.dict()
+            similar_tickets, ticket.model_dump()
         )
-        return {
+        payload = {
             "suggestion": suggestion,
             "similar_tickets": similar_tickets.to_dict(orient="records"),
         }
+        suggestion_cache[cache_key] = payload
+        return payload
     except Exception as ai_suggestion_err:
         logger.error("Error generating AI suggestion: %s", ai_suggestion_err)
         raise HTTPException(
@@ -207,22 +446,14 @@ def resolve_ticket(
             resolved_ticket_dict["agent_name"] = "Alex Sheldrick"
             resolved_ticket_dict["feedback"] = resolve_input.feedback or "N/A"
 
-            resolved_ticket_df = pd.DataFrame([resolved_ticket_dict])
-            service.resolved_tickets_df = pd.concat(
-                [service.resolved_tickets_df, resolved_ticket_df],
-                ignore_index=True,
-            )
+            service.add_resolved_ticket(resolved_ticket_dict)
 
-            background_tasks.add_task(service.save_to_csv)
+            # Save after the response is sent; sync tasks run in the
+            # threadpool, so the write never blocks the event loop
+            background_tasks.add_task(service.save_to_parquet)
 
             NewTicketManager.drop_ticket_by_idx(ticket_idx)
 
-            NewTicketManager.tickets_df[COLUMN_RESOLVED] = (
-                NewTicketManager.tickets_df[COLUMN_RESOLVED]
-                .fillna(False)
-                .astype(bool)
-            )
-
             return {
                 "message": "Ticket resolved successfully",
                 "resolved_ticket": resolved_ticket_dict,
@@ -243,18 +474,9 @@ def resolve_ticket(
 def get_resolved_tickets(service: TicketService = Depends(get_ticket_service)):
     """Fetch all resolved tickets."""
     try:
-        if service.resolved_tickets_df.empty:
-            return []
-
-        sanitized_df = service.resolved_tickets_df.replace(
-            [float("inf"), float("-inf"), float("nan")], None
-        ).fillna("N/A")
-
-        tickets = sanitized_df.drop(
-            columns=[COLUMN_TEXT], errors="ignore"
-        ).to_dict(orient="records")
-
-        return tickets
+        return fastapi.Response(
+            content=service.get_records_json(), media_type="application/json"
+        )
     except Exception as resolved_tickets_err:
         logger.error("Error in get_resolved_tickets: %s", resolved_tickets_err)
         raise HTTPException(
@@ -268,10 +490,11 @@ def remove_resolved_ticket(
 ):
     """Remove a ticket from the resolved tickets list."""
     try:
-        service.resolved_tickets_df = service.resolved_tickets_df[
-            service.resolved_tickets_df[COLUMN_TICKET_ID] != ticket_id
-        ]
-        service.save_to_csv()
+        with service.lock:
+            service.resolved_tickets_df = service.resolved_tickets_df[
+                service.resolved_tickets_df[COLUMN_TICKET_ID] != ticket_id
+            ]
+        service.save_to_parquet()
         return {"message": f"Ticket {ticket_id} removed from resolved tickets"}
     except Exception as remove_err:
         logger.error(
@@ -3,90 +3,141 @@ This module provides a DataLoader class to load data from various file formats
 into a pandas DataFrame.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 import json
 import os
 
 import pandas as pd
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Target data type for each known ticket column
+COLUMN_TYPES = {
+    "ticket_id": str,
+    "issue": "string[pyarrow]",
+    "category": str,
+    "resolution": "string[pyarrow]",
+    "agent_name": str,
+    "resolved": bool,
+    "description": "string[pyarrow]",
+    "ai_suggestion_helpful": bool,
+    "feedback": str,
+}
 
 
 class DataLoader:
     """
-    DataLoader class to handle loading of ticket data from CSV, XLSX, and JSON
-    files.
+    DataLoader class to handle loading of ticket data from CSV, XLSX, JSON and
+    Parquet files.
     """
 
-    def __init__(self, file_paths: list[str]):
+    def __init__(
+        self, file_paths: list[str], columns: Optional[list[str]] = None
+    ):
         """
         Initializes the DataLoader with a list of file paths.
 
         :param file_paths: List of file paths to load data from.
+        :param columns: Normalized names of the columns to load. Other
+            columns are skipped by the readers. Loads all columns if None.
         """
         self.file_paths = file_paths
+        self.columns = columns
         self.data_frames: list[pd.DataFrame] = []
 
     def load_data(self) -> pd.DataFrame:
         """
         Loads data from the specified file paths and concatenates them into a
-        single DataFrame.
+        single DataFrame. Files are read concurrently, one thread per file.
+        This overlaps file I/O and the Arrow CSV and Parquet readers, which
+        release the GIL; the XLSX and JSON parsers are pure Python and gain
+        no parallel speedup.
 
         :return: A pandas DataFrame containing all the loaded data.
         """
-        for file_path in self.file_paths:
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext == ".csv":
-                df = self._load_csv(file_path)
-            elif ext == ".xlsx":
-                df = self._load_xlsx(file_path)
-            elif ext == ".json":
-                df = self._load_json(file_path)
-            else:
-                raise ValueError(f"Unsupported file format: {ext}")
-
-            df = self.normalize_names(df)
-            self.data_frames.append(df)
+        with ThreadPoolExecutor(max_workers=len(self.file_paths)) as executor:
+            self.data_frames = list(
+                executor.map(self._load_file, self.file_paths)
+            )
 
         combined_df = pd.concat(self.data_frames, ignore_index=True)
         combined_df = self._set_types(combined_df)
         return combined_df
 
+    def _load_file(self, file_path: str) -> pd.DataFrame:
+        """
+        Loads a single file, dispatching on its extension, and normalizes its
+        column names.
+
+        :param file_path: The path to the file.
+        :return: A pandas DataFrame containing the data.
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".csv":
+            df = self._load_csv(file_path)
+        elif ext == ".xlsx":
+            df = self._load_xlsx(file_path)
+        elif ext == ".json":
+            df = self._load_json(file_path)
+        elif ext == ".parquet":
+            df = self._load_parquet(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {ext}")
+
+        return self.normalize_names(df)
+
     def _set_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Set the types of the columns to the correct data type.
-        """
-        # Set the correct data types for each column
-        if "ticket_id" in df.columns:
-            df["ticket_id"] = df["ticket_id"].astype(str)
-        if "issue" in df.columns:
-            df["issue"] = df["issue"].astype(str)
-        if "category" in df.columns:
-            df["category"] = df["category"].astype(str)
-        if "resolution" in df.columns:
-            df["resolution"] = df["resolution"].astype(str)
+        Set the types of the columns to the correct data type. Free-text
+        columns are Arrow-backed so string operations run in Arrow kernels,
+        with missing text filled as empty strings and missing flags as False.
+        """
+        # Missing flags are False; casting NA or NaN to bool fails or is True
+        bool_columns = [
+            column
+            for column, dtype in COLUMN_TYPES.items()
+            if dtype is bool and column in df.columns
+        ]
+        with pd.option_context("future.no_silent_downcasting", True):
+            df[bool_columns] = df[bool_columns].fillna(False)
+        # Only cast columns that are present and not already the right type
+        dtypes = {
+            column: dtype
+            for column, dtype in COLUMN_TYPES.items()
+            if column in df.columns and df[column].dtype != dtype
+        }
+        df = df.astype(dtypes)
+        # Arrow strings keep nulls as pd.NA, which Ticket cannot hold
+        text_columns = [
+            column
+            for column, dtype in COLUMN_TYPES.items()
+            if dtype == "string[pyarrow]" and column in df.columns
+        ]
+        df[text_columns] = df[text_columns].fillna("")
         if "date" in df.columns:
             df["date"] = pd.to_datetime(df["date"], format="mixed")
-        if "agent_name" in df.columns:
-            df["agent_name"] = df["agent_name"].astype(str)
-        if "resolved" in df.columns:
-            df["resolved"] = df["resolved"].astype(bool)
-        if "description" in df.columns:
-            df["description"] = df["description"].astype(str)
-        if "ai_suggestion_helpful" in df.columns:
-            df["ai_suggestion_helpful"] = df["ai_suggestion_helpful"].astype(
-                bool
-            )
-        if "feedback" in df.columns:
-            df["feedback"] = df["feedback"].astype(str)
 
         return df
 
     def _load_csv(self, file_path: str) -> pd.DataFrame:
         """
-        Loads data from a CSV file.
+        Loads data from a CSV file using Arrow's CSV reader.
 
         :param file_path: The path to the CSV file.
         :return: A pandas DataFrame containing the data.
         """
-        return pd.read_csv(file_path)
+        convert_options = None
+        if self.columns is not None:
+            header = pacsv.open_csv(file_path).schema.names
+            convert_options = pacsv.ConvertOptions(
+                include_columns=[
+                    name for name in header if self._keep_column(name)
+                ]
+            )
+        return pacsv.read_csv(
+            file_path, convert_options=convert_options
+        ).to_pandas(types_mapper=pd.ArrowDtype)
 
     def _load_xlsx(self, file_path: str) -> pd.DataFrame:
         """
@@ -97,7 +148,12 @@ class DataLoader:
         """
         # Read all sheets and concatenate them
         return pd.concat(
-            pd.read_excel(file_path, sheet_name=None), ignore_index=True
+            pd.read_excel(
+                file_path,
+                sheet_name=None,
+                usecols=self._keep_column,
+            ),
+            ignore_index=True,
         )
 
     def _load_json(self, file_path: str) -> pd.DataFrame:
@@ -109,9 +165,41 @@ class DataLoader:
         """
         with open(file_path, "r", encoding="utf-8") as file:
             data = json.load(file)
+        if isinstance(data, dict):
+            # Column-oriented JSON: drop unused columns before building
+            data = {
+                name: values
+                for name, values in data.items()
+                if self._keep_column(name)
+            }
         df = pd.DataFrame.from_dict(data)
         return df
 
+    def _load_parquet(self, file_path: str) -> pd.DataFrame:
+        """
+        Loads data from a Parquet file.
+
+        :param file_path: The path to the Parquet file.
+        :return: A pandas DataFrame containing the data.
+        """
+        columns = None
+        if self.columns is not None:
+            columns = [
+                name
+                for name in pq.read_schema(file_path).names
+                if self._keep_column(name)
+            ]
+        return pd.read_parquet(file_path, engine="pyarrow", columns=columns)
+
+    def _keep_column(self, name: str) -> bool:
+        """
+        Whether a raw column name is one of the requested columns, compared
+        after the same normalization as normalize_names.
+        """
+        if self.columns is None:
+            return True
+        return name.lower().replace(" ", "_") in self.columns
+
     def normalize_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize the names of the columns.
@@ -9,6 +9,37 @@ import openai
 
 import aleph_alpha_client
 
+# Model used by each provider
+MODELS = {
+    "openai": "gpt-4o-mini",
+    "aleph-alpha": "llama-3.1-70b-instruct",
+    "aleph-alpha_luminous": "luminous-supreme-control-20240215",
+}
+
+# Bump when the prompts change, so cached suggestions are not reused
+PROMPT_VERSION = 1
+
+# Static prompt sections, shared across requests
+LUMINOUS_PROMPT_INPUT = (
+    "### Input: The following are similar tickets and their resolutions:\n"
+    " Use them to inform your response.\n\n"
+)
+LUMINOUS_PROMPT_RESPONSE = "### Response:"
+OPENAI_PROMPT_SIMILAR = (
+    "The following are similar tickets and their resolutions:\n"
+)
+OPENAI_PROMPT_INSTRUCTION = (
+    "Think step by step. Evaluate the similar tickets and the new "
+    "ticket. Reason whether the similar tickets are relevant and then,"
+    " based on these similar tickets and their resolutions, please "
+    "suggest a potential solution or next steps for the new ticket.\n"
+    "\nYour response should be concise and in the following format:\n"
+    "<Suggested Solution>\n"
+    "... your response ...\n"
+    "</Suggested Solution>\n"
+    "When referring to the similar tickets, use the Ticket ID."
+)
+
 
 class AISuggestionEngine:
     """
@@ -32,6 +63,7 @@ class AISuggestionEngine:
             self.client = aleph_alpha_client.Client(token=os.getenv("AA_KEY"))
         else:
             raise ValueError(f"Invalid provider: {provider}")
+        self.model = MODELS[provider]
 
     def generate_suggestion(
         self, similar_tickets: pd.DataFrame, new_ticket: dict[str, str]
@@ -63,11 +95,7 @@ class AISuggestionEngine:
 
         # Call the LLM API
         response = self.client.chat.completions.create(
-            model=(
-                "gpt-4o-mini"
-                if self.provider == "openai"
-                else "llama-3.1-70b-instruct"
-            ),
+            model=self.model,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant."},
                 {"role": "user", "content": user_prompt},
@@ -95,9 +123,7 @@ class AISuggestionEngine:
             # maximum_tokens=350,
             temperature=0.7,
         )
-        response = self.client.complete(
-            request, model="luminous-supreme-control-20240215"
-        )
+        response = self.client.complete(request, model=self.model)
         suggestion = response.completions[0].completion
         return suggestion
 
@@ -108,20 +134,24 @@ class AISuggestionEngine:
         Builds a prompt for the LLM based on similar tickets and the new
         ticket.
         """
-        prompt = "### Instruction:\n Find a solution to this IT issue\n"
-        prompt += f"Issue: {new_ticket['issue']}\n"
-        prompt += f"Description: {new_ticket['description']}\n\n"
-        prompt += "### Input: The following are similar tickets and their "
-        prompt += "resolutions:\n Use them to inform your response.\n\n"
-
-        for _, row in similar_tickets.iterrows():
-            prompt += f"<Ticket ID: {row['ticket_id']}>\n"
-            prompt += f"<Issue: {row['issue']}>\n"
-            prompt += f"<Description: {row['description']}>\n"
-            prompt += f"Resolution: {row['resolution']}\n\n"
+        parts = [
+            "### Instruction:\n Find a solution to this IT issue\n",
+            f"Issue: {new_ticket['issue']}\n",
+            f"Description: {new_ticket['description']}\n\n",
+            LUMINOUS_PROMPT_INPUT,
+        ]
+
+        columns = ["ticket_id", "issue", "description", "resolution"]
+        for row in similar_tickets[columns].itertuples(index=False):
+            parts.append(
+                f"<Ticket ID: {row.ticket_id}>\n"
+                f"<Issue: {row.issue}>\n"
+                f"<Description: {row.description}>\n"
+                f"Resolution: {row.resolution}\n\n"
+            )
 
-        prompt += "### Response:"
-        return prompt
+        parts.append(LUMINOUS_PROMPT_RESPONSE)
+        return "".join(parts)
 
     def _build_user_prompt_openai(
         self, similar_tickets: pd.DataFrame, new_ticket: dict[str, str]
@@ -134,30 +164,25 @@ class AISuggestionEngine:
         :param new_ticket: Dictionary containing the details of the new ticket.
         :return: A string containing the prompt to be sent to the LLM.
         """
-        prompt = f"Here is a new ticket:\nIssue: {new_ticket['issue']}"
-        prompt += f"\nDescription: {new_ticket['description']}\n"
-        prompt += "The following are similar tickets and their resolutions:\n"
-
-        for idx, row in similar_tickets.iterrows():
-            prompt += f"<Similar Ticket {idx+1}>\n"
-            prompt += f"Ticket ID: {row['ticket_id']}\n"
-            prompt += f"Issue: {row['issue']}\n"
-            prompt += f"Description: {row['description']}\n"
-            prompt += f"Resolution: {row['resolution']}\n\n"
-            prompt += f"</Similar Ticket {idx+1}>\n"
-
-        prompt += (
-            "Think step by step. Evaluate the similar tickets and the new "
-            "ticket. Reason whether the similar tickets are relevant and then,"
-            " based on these similar tickets and their resolutions, please "
-            "suggest a potential solution or next steps for the new ticket.\n"
-            "\nYour response should be concise and in the following format:\n"
-            "<Suggested Solution>\n"
-            "... your response ...\n"
-            "</Suggested Solution>\n"
-            "When referring to the similar tickets, use the Ticket ID."
-        )
-        return prompt
+        parts = [
+            f"Here is a new ticket:\nIssue: {new_ticket['issue']}",
+            f"\nDescription: {new_ticket['description']}\n",
+            OPENAI_PROMPT_SIMILAR,
+        ]
+
+        columns = ["ticket_id", "issue", "description", "resolution"]
+        for row in similar_tickets[columns].itertuples():
+            parts.append(
+                f"<Similar Ticket {row.Index+1}>\n"
+                f"Ticket ID: {row.ticket_id}\n"
+                f"Issue: {row.issue}\n"
+                f"Description: {row.description}\n"
+                f"Resolution: {row.resolution}\n\n"
+                f"</Similar Ticket {row.Index+1}>\n"
+            )
+
+        parts.append(OPENAI_PROMPT_INSTRUCTION)
+        return "".join(parts)
 
     def _parse_answer(self, answer: str) -> str:
         """
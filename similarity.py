@@ -1,8 +1,20 @@
 """ Similarity Engine for finding similar tickets."""
 
+import hashlib
+import os
+
+import joblib
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import sklearn
 from sklearn import feature_extraction
-from sklearn import metrics
+from sklearn import preprocessing
+
+# Fitted vectorizers are cached here, keyed by a hash of the ticket text,
+# the vectorizer settings and the scikit-learn version
+CACHE_DIR = "cache"
 
 
 class SimilarityEngine:
@@ -21,18 +33,58 @@ class SimilarityEngine:
             stop_words="english"
         )
         self._fit()
+        # Columns returned by find_similar_tickets, projected once
+        self._view_df = self.resolved_tickets_df[
+            ["ticket_id", "issue", "resolution", "description"]
+        ]
 
     def _fit(self):
         """
-        Fits the TF-IDF vectorizer on the ticket text data.
+        Fits the TF-IDF vectorizer on the ticket text data. The fitted
+        vectorizer and matrix are loaded from the cache when the text and
+        vectorizer settings are unchanged since the last fit.
         """
-        self.resolved_tickets_df["text"] = (
-            self.resolved_tickets_df["issue"]
-            + " "
-            + self.resolved_tickets_df["description"]
+        # Join in Arrow's native kernel rather than an object-dtype loop
+        issue = pa.array(self.resolved_tickets_df["issue"].array)
+        description = pa.array(self.resolved_tickets_df["description"].array)
+        text = pc.binary_join_element_wise(
+            issue,
+            description,
+            pa.scalar(" ", type=issue.type),
+            null_handling="replace",
+        )
+        # Kept out of the DataFrame, which is shared with the TicketManager
+        text = pd.Series(pd.arrays.ArrowExtensionArray(text))
+        key = hashlib.sha256()
+        key.update(sklearn.__version__.encode("utf-8"))
+        key.update(
+            repr(sorted(self.vectorizer.get_params().items())).encode("utf-8")
         )
-        self.tfidf_matrix = self.vectorizer.fit_transform(
-            self.resolved_tickets_df["text"]
+        key.update(
+            "\n".join(text).encode("utf-8")
+        )
+        cache_path = os.path.join(CACHE_DIR, f"tfidf_{key.hexdigest()}.joblib")
+
+        cached = None
+        if os.path.exists(cache_path):
+            try:
+                cached = joblib.load(cache_path)
+            except Exception:
+                # An unreadable cache entry is refitted and overwritten
+                cached = None
+        if cached is not None:
+            self.vectorizer, self.tfidf_matrix = cached
+        else:
+            self.tfidf_matrix = self.vectorizer.fit_transform(text)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write to a temporary file, then rename atomically
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            joblib.dump((self.vectorizer, self.tfidf_matrix), tmp_path)
+            os.replace(tmp_path, cache_path)
+
+        # Normalize once so cosine similarity is a plain dot product
+        self._normalized_matrix = preprocessing.normalize(
+            self.tfidf_matrix, norm="l2", copy=False
         )
 
     def find_similar_tickets(
@@ -45,14 +97,17 @@ class SimilarityEngine:
         :param top_k: Number of similar tickets to return.
         :return: DataFrame containing the top K similar tickets.
         """
-        ticket_vector = self.vectorizer.transform([ticket_text])
-        similarity_scores = metrics.pairwise.cosine_similarity(
-            ticket_vector, self.tfidf_matrix
+        ticket_vector = preprocessing.normalize(
+            self.vectorizer.transform([ticket_text]), copy=False
         )
-        similar_indices = similarity_scores.argsort()[0, -top_k:][::-1]
-        return self.resolved_tickets_df.iloc[similar_indices][
-            ["ticket_id", "issue", "resolution", "description"]
+        scores = (self._normalized_matrix @ ticket_vector.T).toarray().ravel()
+        top_k = min(top_k, len(scores))
+        # Partition out the top K, then sort only those
+        similar_indices = np.argpartition(scores, -top_k)[-top_k:]
+        similar_indices = similar_indices[
+            np.argsort(scores[similar_indices])[::-1]
         ]
+        return self._view_df.iloc[similar_indices]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""Tests for the DataLoader."""
+
+from data_loader import DataLoader
+
+
+def test_blank_bool_cells_load_as_false(tmp_path):
+    """Blank resolved and ai_suggestion_helpful cells become False."""
+    csv_path = tmp_path / "tickets.csv"
+    csv_path.write_text(
+        "Ticket ID,Issue,Description,Resolved,AI Suggestion Helpful\n"
+        "TCKT-1,VPN down,No VPN,,\n"
+        "TCKT-2,Printer jam,Paper stuck,True,False\n"
+    )
+
+    df = DataLoader([str(csv_path)]).load_data()
+
+    assert df["resolved"].dtype == bool
+    assert df["ai_suggestion_helpful"].dtype == bool
+    assert df["resolved"].tolist() == [False, True]
+    assert df["ai_suggestion_helpful"].tolist() == [False, False]
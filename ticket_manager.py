@@ -1,11 +1,22 @@
 """ Ticket Manager for managing tickets and pydantic models for tickets."""
 
 from typing import Optional
+import threading
+
 import pydantic
 import pandas as pd
 
 from data_loader import DataLoader
 
+# Columns written when resolving a ticket, with the value for unresolved rows
+RESOLUTION_DEFAULTS = {
+    "resolution": "",
+    "resolved": False,
+    "agent_name": "",
+    "ai_suggestion_helpful": False,
+    "feedback": "N/A",
+}
+
 
 class Ticket(pydantic.BaseModel):
     """
@@ -17,45 +28,144 @@ class Ticket(pydantic.BaseModel):
     description: str
     resolved: bool = False
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = pydantic.ConfigDict(from_attributes=True)
 
 
 class TicketManager:
     """
     Manages the fetching of new tickets and keeps track of the current ticket.
+
+    Tickets are stored column-wise as plain Python lists, so row access and
+    updates are list indexing. A DataFrame is only built when tickets_df is
+    read. A change touches the lists one at a time, so all access holds a
+    lock and never sees a half-applied change.
     """
 
-    def __init__(self, tickets_df: pd.DataFrame):
+    # The DataLoader types the columns and fills missing text, so rows skip
+    # Pydantic validation
+    _build = Ticket.model_construct
+
+    def __init__(self, tickets_df: pd.DataFrame, resolvable: bool = False):
         """
         Initializes the TicketManager with a DataFrame of tickets.
 
         :param tickets_df: DataFrame containing the ticket data.
+        :param resolvable: Whether tickets get resolved through this manager,
+            in which case the resolution columns are allocated up front.
         """
+        # The manager is shared by API handlers running on several threads
+        self._lock = threading.RLock()
+        self._resolvable = resolvable
         self.tickets_df = tickets_df
         self.current_index = 0
 
+    @property
+    def tickets_df(self) -> pd.DataFrame:
+        """
+        DataFrame of all tickets, built on demand and reused until the
+        tickets change. The same frame is shared by every reader, so treat it
+        as read-only; changes made to it are not written back.
+        """
+        with self._lock:
+            if self._tickets_df is None:
+                self._tickets_df = pd.DataFrame(self._columns).astype(
+                    self._dtypes
+                )
+            return self._tickets_df
+
+    @tickets_df.setter
+    def tickets_df(self, tickets_df: pd.DataFrame):
+        with self._lock:
+            self._columns: dict[str, list] = {
+                column: tickets_df[column].tolist()
+                for column in tickets_df.columns
+            }
+            # Allocate the resolution columns up front, not one per resolve
+            if self._resolvable:
+                for column, default in RESOLUTION_DEFAULTS.items():
+                    if column not in self._columns:
+                        self._columns[column] = [default] * len(tickets_df)
+            # Non-object dtypes, restored when the DataFrame is rebuilt
+            self._dtypes = {
+                column: dtype
+                for column, dtype in tickets_df.dtypes.items()
+                if dtype != object
+            }
+            self._n = len(tickets_df)
+            self._tickets_df: Optional[pd.DataFrame] = None
+            self._rebuild_id_index()
+
+    def _rebuild_id_index(self):
+        """
+        Rebuilds the ticket_id to row position mapping. The first row wins
+        for duplicated IDs, matching a boolean-mask lookup.
+        """
+        ticket_ids = self._columns["ticket_id"]
+        # Built back to front so earlier rows overwrite later duplicates
+        self._id_index = dict(
+            zip(reversed(ticket_ids), range(len(ticket_ids) - 1, -1, -1))
+        )
+
+    def _row(self, idx: int) -> dict:
+        """
+        Returns the Ticket fields of the row at a position as a dict.
+
+        :param idx: The position of the row.
+        """
+        columns = self._columns
+        return {
+            column: columns[column][idx]
+            for column in Ticket.model_fields
+            if column in columns
+        }
+
+    def _set(self, idx: int, column: str, value):
+        """
+        Sets a single value, adding the column if it doesn't exist yet.
+
+        :param idx: The position of the row.
+        :param column: The column to set.
+        :param value: The new value.
+        """
+        if column not in self._columns:
+            self._columns[column] = [self._default(column)] * self._n
+        self._columns[column][idx] = value
+        self._tickets_df = None
+
+    @staticmethod
+    def _default(column: str):
+        """
+        Returns the fill value for rows that lack a column: the resolution
+        default or Ticket field default if there is one, otherwise None.
+
+        :param column: The column name.
+        """
+        if column in RESOLUTION_DEFAULTS:
+            return RESOLUTION_DEFAULTS[column]
+        field = Ticket.model_fields.get(column)
+        if field is None or field.is_required():
+            return None
+        return field.default
+
     def fetch_current_ticket(self) -> Optional[Ticket]:
         """
         Fetches the current ticket.
 
         :return: A Ticket object if found, otherwise None.
         """
-        if 0 <= self.current_index < len(self.tickets_df):
-            ticket_data = self.tickets_df.iloc[self.current_index].to_dict()
-            return Ticket(**ticket_data)
-        return None
+        with self._lock:
+            if 0 <= self.current_index < self._n:
+                return self._build(**self._row(self.current_index))
+            return None
 
     def drop_current_ticket(self):
         """
-        Drops the current ticket from the DataFrame.
+        Drops the current ticket.
         """
-        if 0 <= self.current_index < len(self.tickets_df):
-            self.tickets_df = self.tickets_df.drop(self.current_index)
-            self.tickets_df = self.tickets_df.reset_index(drop=True)
-            self.current_index -= 1
+        with self._lock:
+            if 0 <= self.current_index < self._n:
+                self._drop_position(self.current_index)
+                self.current_index -= 1
 
     def drop_ticket_by_id(self, ticket_id: str):
         """
@@ -63,10 +173,10 @@ class TicketManager:
 
         :param ticket_id: The ID of the ticket to drop.
         """
-        self.tickets_df = self.tickets_df[
-            self.tickets_df["ticket_id"] != ticket_id
-        ]
-        self.tickets_df = self.tickets_df.reset_index(drop=True)
+        with self._lock:
+            idx = self._id_index.get(ticket_id)
+            if idx is not None:
+                self._drop_position(idx)
 
     def get_ticket_by_id(self, ticket_id: str) -> Optional[Ticket]:
         """
@@ -75,24 +185,29 @@ class TicketManager:
         :param ticket_id: The ID of the ticket to retrieve.
         :return: A Ticket object if found, otherwise None.
         """
-        ticket_data = self.tickets_df[
-            self.tickets_df["ticket_id"] == ticket_id  # str
-        ]
-        if not ticket_data.empty:
-            return Ticket(**ticket_data.iloc[0].to_dict())
-        else:
-            return None
+        with self._lock:
+            idx = self._id_index.get(ticket_id)
+            if idx is not None:
+                return self._build(**self._row(idx))
+            else:
+                return None
 
     def add_ticket(self, ticket: Ticket):
         """
-        Adds a new ticket to the DataFrame.
+        Adds a new ticket.
 
         :param ticket: The Ticket object to be added.
         """
-        new_ticket_df = pd.DataFrame([ticket.model_dump()])
-        self.tickets_df = pd.concat(
-            [self.tickets_df, new_ticket_df], ignore_index=True
-        )
+        row = ticket.model_dump()
+        with self._lock:
+            for column in row:
+                if column not in self._columns:
+                    self._columns[column] = [self._default(column)] * self._n
+            for column, values in self._columns.items():
+                values.append(row.get(column, self._default(column)))
+            self._id_index.setdefault(ticket.ticket_id, self._n)
+            self._n += 1
+            self._tickets_df = None
 
     def fetch_ticket_by_idx(self, idx: int) -> Optional[Ticket]:
         """
@@ -101,10 +216,10 @@ class TicketManager:
         :param idx: The index of the ticket to retrieve.
         :return: A Ticket object if found, otherwise None.
         """
-        if 0 <= idx < len(self.tickets_df):
-            ticket_data = self.tickets_df.iloc[idx].to_dict()
-            return Ticket(**ticket_data)
-        return None
+        with self._lock:
+            if 0 <= idx < self._n:
+                return self._build(**self._row(idx))
+            return None
 
     def drop_ticket_by_idx(self, idx: int):
         """
@@ -112,9 +227,21 @@ class TicketManager:
 
         :param idx: The index of the ticket to drop.
         """
-        if 0 <= idx < len(self.tickets_df):
-            self.tickets_df = self.tickets_df.drop(idx)
-            self.tickets_df = self.tickets_df.reset_index(drop=True)
+        with self._lock:
+            if 0 <= idx < self._n:
+                self._drop_position(idx)
+
+    def _drop_position(self, idx: int):
+        """
+        Drops the row at a position from every column.
+
+        :param idx: The position of the row to drop.
+        """
+        for values in self._columns.values():
+            del values[idx]
+        self._n -= 1
+        self._tickets_df = None
+        self._rebuild_id_index()
 
     def resolve_ticket(
         self,
@@ -134,30 +261,34 @@ class TicketManager:
         :param feedback: Optional feedback from the agent.
         :return: The resolved Ticket object if successful, otherwise None.
         """
-        if 0 <= idx < len(self.tickets_df):
-            self.tickets_df.at[idx, "resolution"] = resolution
-            self.tickets_df.at[idx, "resolved"] = True
-            self.tickets_df.at[idx, "agent_name"] = agent_name
-            self.tickets_df.at[idx, "ai_suggestion_helpful"] = (
-                ai_suggestion_helpful
-            )
-            self.tickets_df.at[idx, "feedback"] = (
-                feedback if feedback else "N/A"
-            )
-
-            return Ticket(**self.tickets_df.iloc[idx].to_dict())
-        return None
+        with self._lock:
+            if 0 <= idx < self._n:
+                self._set(idx, "resolution", resolution)
+                self._set(idx, "resolved", True)
+                self._set(idx, "agent_name", agent_name)
+                self._set(idx, "ai_suggestion_helpful", ai_suggestion_helpful)
+                self._set(idx, "feedback", feedback if feedback else "N/A")
+
+                return self._build(**self._row(idx))
+            return None
 
     def get_all_tickets(self) -> list[Ticket]:
         """
-        Retrieves all tickets in the DataFrame.
+        Retrieves all tickets.
 
         :return: A list of Ticket objects.
         """
-        return [
-            Ticket(**{str(k): v for k, v in ticket.items()})
-            for ticket in self.tickets_df.to_dict(orient="records")
-        ]
+        with self._lock:
+            columns = [
+                column
+                for column in Ticket.model_fields
+                if column in self._columns
+            ]
+            # Copy the columns so the tickets are built outside the lock
+            values = [self._columns[column][:] for column in columns]
+        # Local names keep the loop body on fast local lookups
+        build, dict_, zip_ = self._build, dict, zip
+        return [build(**dict_(zip_(columns, row))) for row in zip_(*values)]
 
 
 if __name__ == "__main__":
@@ -2,14 +2,57 @@
 This is a simple UI for the IT Helpdesk Ticket Resolution System.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import orjson
 import streamlit as st
+from streamlit.runtime.scriptrunner import (
+    add_script_run_ctx,
+    get_script_run_ctx,
+)
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 
 # FastAPI server URL
 FASTAPI_URL = "https://aa-ticket-assistant-8bc2cf7b8318.herokuapp.com"  # "http://127.0.0.1:8000"
 TIMEOUT = 180
 
+
+@st.cache_resource
+def _get_session() -> requests.Session:
+    """Shared session so API calls reuse pooled keep-alive connections. It is
+    a cached resource because Streamlit re-executes this script per run."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+_SESSION = _get_session()
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared executor for requests that outlive a single script run."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+# Columns returned by the all-tickets and resolved-tickets endpoints
+TICKET_COLS = ["ticket_id", "issue", "description", "resolved"]
+RESOLVED_TICKET_COLS = [
+    "ticket_id",
+    "issue",
+    "description",
+    "resolution",
+    "resolved",
+    "agent_name",
+    "ai_suggestion_helpful",
+    "feedback",
+]
+
 # Initialize session state
 SESSION_KEYS = {
     "resolved_tickets_df": "resolved_tickets_df",
@@ -18,45 +61,54 @@ SESSION_KEYS = {
     "similar_tickets_df": "similar_tickets_df",
     "all_tickets_df": "all_tickets_df",
     "current_index": "current_index",
+    "ai_suggestion_request": "ai_suggestion_request",
 }
 
 for key, default_value in {
     SESSION_KEYS["resolved_tickets_df"]: pd.DataFrame(
-        columns=[
-            "ticket_id",
-            "issue",
-            "description",
-            "resolution",
-            "resolved",
-            "agent_name",
-            "ai_suggestion_helpful",
-            "feedback",
-        ]
+        columns=RESOLVED_TICKET_COLS
     ),
     SESSION_KEYS["current_ticket"]: None,
     SESSION_KEYS["ai_suggestion"]: None,
     SESSION_KEYS["similar_tickets_df"]: pd.DataFrame(),
     SESSION_KEYS["all_tickets_df"]: pd.DataFrame(),
     SESSION_KEYS["current_index"]: 0,
+    SESSION_KEYS["ai_suggestion_request"]: None,
 }.items():
     if key not in st.session_state:
         st.session_state[key] = default_value
 
 
-def fetch_data_from_api(endpoint: str, params: dict = None):
+def _get_json(endpoint: str, params: dict = None):
+    """GET the specified API endpoint and decode its JSON body."""
+    api_response = _SESSION.get(
+        f"{FASTAPI_URL}/{endpoint}", params=params, timeout=30
+    )
+    api_response.raise_for_status()
+    return orjson.loads(api_response.content)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_get_json(endpoint: str):
+    """GET an endpoint, cached across reruns and sessions. Errors raise, so
+    failed fetches are never cached."""
+    return _get_json(endpoint)
+
+
+def fetch_data_from_api(
+    endpoint: str, params: dict = None, cached: bool = False
+):
     """Fetch data from the specified API endpoint."""
     try:
-        api_response = requests.get(
-            f"{FASTAPI_URL}/{endpoint}", params=params, timeout=30
-        )
-        api_response.raise_for_status()
-        return api_response.json()
+        if cached:
+            return _cached_get_json(endpoint)
+        return _get_json(endpoint, params)
     except requests.HTTPError as http_err:
         st.error(
             f"HTTP error occurred while fetching data from "
             f"{endpoint}: {http_err}"
         )
-    except requests.RequestException as req_err:
+    except (requests.RequestException, orjson.JSONDecodeError) as req_err:
         st.error(
             f"Failed to fetch data from {endpoint}. Please try again later: "
             f"{req_err}"
@@ -66,30 +118,76 @@ def fetch_data_from_api(endpoint: str, params: dict = None):
 
 def fetch_all_tickets():
     """Fetch all tickets and update the session state."""
-    tickets = fetch_data_from_api("all-tickets")
+    tickets = fetch_data_from_api("all-tickets", cached=True)
     if tickets is not None:
-        st.session_state["all_tickets_df"] = pd.DataFrame(tickets)
+        st.session_state["all_tickets_df"] = pd.DataFrame.from_records(
+            tickets, columns=TICKET_COLS
+        )
 
 
 def fetch_resolved_tickets():
     """Fetch resolved tickets and update the session state."""
-    resolved_tickets = fetch_data_from_api("resolved-tickets")
+    resolved_tickets = fetch_data_from_api("resolved-tickets", cached=True)
     if resolved_tickets is not None:
-        st.session_state["resolved_tickets_df"] = pd.DataFrame(
-            resolved_tickets
-        )  # type: ignore
+        st.session_state["resolved_tickets_df"] = pd.DataFrame.from_records(
+            resolved_tickets, columns=RESOLVED_TICKET_COLS
+        )
+
+
+def fetch_startup_tickets():
+    """Fetch all and resolved tickets concurrently into the session state."""
+    # Worker threads need the script context to use st.* calls
+    ctx = get_script_run_ctx()
+
+    def attach_ctx():
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    with ThreadPoolExecutor(max_workers=2, initializer=attach_ctx) as executor:
+        futures = [
+            executor.submit(fetch_all_tickets),
+            executor.submit(fetch_resolved_tickets),
+        ]
+        for future in futures:
+            future.result()
 
 
 def fetch_ticket_by_idx(idx: int):
     """Fetch a specific ticket by index and update the session state."""
+    all_tickets_df = st.session_state["all_tickets_df"]
+    if 0 <= idx < len(all_tickets_df):
+        # Records keep the values as native types for the JSON request body
+        st.session_state["current_ticket"] = all_tickets_df.iloc[
+            [idx]
+        ].to_dict(orient="records")[0]
+        return
     ticket = fetch_data_from_api(f"ticket/{idx}")
     if ticket is not None:
         st.session_state["current_ticket"] = ticket
 
 
+def start_background_post(url: str, **kwargs) -> dict:
+    """Start a POST on the shared executor. Keep the returned request in the
+    session state and pass it to poll_background_post on later runs."""
+    return {
+        "future": _get_executor().submit(_SESSION.post, url, **kwargs),
+        "started": time.monotonic(),
+    }
+
+
+def poll_background_post(request: dict, status, label: str):
+    """Wait up to a second for a background POST. While it runs, show the
+    label and elapsed time on the status and return None; once done, return
+    the response or raise its error."""
+    future = request["future"]
+    if not wait([future], timeout=1).done:
+        elapsed = time.monotonic() - request["started"]
+        status.update(label=f"{label} {elapsed:.0f}s")
+        return None
+    return future.result()
+
+
 # Fetch all tickets and resolved tickets at the start of the session
-fetch_all_tickets()
-fetch_resolved_tickets()
+fetch_startup_tickets()
 
 # Fetch the first ticket by its ID if it hasn't been fetched yet
 if (
@@ -100,124 +198,189 @@ if (
 
 st.title("IT Helpdesk Ticket Resolution System")
 
-# Navigation arrows and current ticket display
-col1, col2, col3 = st.columns([1, 3, 1])
-
-with col1:
-    if st.button("←") and st.session_state["current_index"] > 0:
-        st.session_state["current_index"] -= 1
-        fetch_ticket_by_idx(st.session_state["current_index"])
-
-with col3:
-    if (
-        st.button("→")
-        and st.session_state["current_index"]
-        < len(st.session_state["all_tickets_df"]) - 1
-    ):
-        st.session_state["current_index"] += 1
-        fetch_ticket_by_idx(st.session_state["current_index"])
-
-with col2:
-    st.write(
-        f"Ticket {st.session_state['current_index'] + 1} of "
-        f"{len(st.session_state['all_tickets_df'])}"
-        if not st.session_state["all_tickets_df"].empty
-        else "All done for Today!"
-    )
 
-# Display current ticket as a Pandas DataFrame
-if not st.session_state["all_tickets_df"].empty:
-    st.header("Current Ticket")
-    current_ticket_df = st.session_state["all_tickets_df"].iloc[
-        [st.session_state["current_index"]]
-    ]
-    st.dataframe(current_ticket_df, use_container_width=True)
-
-    # AI Suggestion
-    def create_resolution_form():
-        """Create a resolution form. It clears on submit."""
-        with st.form("resolution_form", clear_on_submit=True):
-            if st.form_submit_button("Get AI Suggestion"):
-                with st.spinner("Fetching AI Suggestion..."):
-                    try:
-                        response = requests.post(
-                            f"{FASTAPI_URL}/ai-suggestion",
-                            json=st.session_state["current_ticket"],
-                            timeout=TIMEOUT,
-                        )
-                        if response.status_code == 200:
-                            suggestion_data = response.json()
-                            st.session_state["ai_suggestion"] = suggestion_data[
-                                "suggestion"
-                            ]
-                            st.session_state["similar_tickets_df"] = (
-                                pd.DataFrame(suggestion_data["similar_tickets"])
+@st.fragment
+def render_ticket_panel():
+    """Render the ticket panel. As a fragment, clicks in it only rerun it."""
+    # Navigation arrows and current ticket display
+    col1, col2, col3 = st.columns([1, 3, 1])
+
+    with col1:
+        if st.button("←") and st.session_state["current_index"] > 0:
+            st.session_state["current_index"] -= 1
+            fetch_ticket_by_idx(st.session_state["current_index"])
+
+    with col3:
+        if (
+            st.button("→")
+            and st.session_state["current_index"]
+            < len(st.session_state["all_tickets_df"]) - 1
+        ):
+            st.session_state["current_index"] += 1
+            fetch_ticket_by_idx(st.session_state["current_index"])
+
+    with col2:
+        st.write(
+            f"Ticket {st.session_state['current_index'] + 1} of "
+            f"{len(st.session_state['all_tickets_df'])}"
+            if not st.session_state["all_tickets_df"].empty
+            else "All done for Today!"
+        )
+
+    # Display current ticket as a Pandas DataFrame
+    if not st.session_state["all_tickets_df"].empty:
+        st.header("Current Ticket")
+        current_ticket_df = st.session_state["all_tickets_df"].iloc[
+            [st.session_state["current_index"]]
+        ]
+        st.dataframe(current_ticket_df, use_container_width=True)
+
+        # AI Suggestion
+        def create_resolution_form():
+            """Create a resolution form. It clears on submit."""
+            with st.form("resolution_form", clear_on_submit=True):
+                if (
+                    st.form_submit_button("Get AI Suggestion")
+                    and st.session_state["ai_suggestion_request"] is None
+                ):
+                    request = start_background_post(
+                        f"{FASTAPI_URL}/ai-suggestion",
+                        json=st.session_state["current_ticket"],
+                        timeout=TIMEOUT,
+                    )
+                    request["ticket_id"] = st.session_state["current_ticket"][
+                        "ticket_id"
+                    ]
+                    st.session_state["ai_suggestion_request"] = request
+
+                request = st.session_state["ai_suggestion_request"]
+                if request is not None and request["ticket_id"] != (
+                    st.session_state["current_ticket"]["ticket_id"]
+                ):
+                    # The agent moved on; drop the suggestion when it lands
+                    st.session_state["ai_suggestion_request"] = None
+                elif request is not None:
+                    label = "Fetching AI Suggestion..."
+                    with st.status(label) as status:
+                        try:
+                            response = poll_background_post(
+                                request, status, label
                             )
-                        else:
+                            if response is None:
+                                pass  # Still running, polled again below
+                            elif response.status_code == 200:
+                                st.session_state["ai_suggestion_request"] = (
+                                    None
+                                )
+                                suggestion_data = orjson.loads(
+                                    response.content
+                                )
+                                st.session_state["ai_suggestion"] = (
+                                    suggestion_data["suggestion"]
+                                )
+                                st.session_state["similar_tickets_df"] = (
+                                    pd.DataFrame(
+                                        suggestion_data["similar_tickets"]
+                                    )
+                                )
+                                status.update(
+                                    label="AI Suggestion ready",
+                                    state="complete",
+                                )
+                            else:
+                                st.session_state["ai_suggestion_request"] = (
+                                    None
+                                )
+                                status.update(state="error")
+                                st.error(
+                                    "Failed to get AI suggestion: "
+                                    f"{response.text}"
+                                )
+                        except (
+                            requests.RequestException,
+                            orjson.JSONDecodeError,
+                        ) as e:
+                            st.session_state["ai_suggestion_request"] = None
+                            status.update(state="error")
                             st.error(
-                                f"Failed to get AI suggestion: {response.text}"
+                                f"Error getting AI suggestion: {str(e)}"
                             )
-                    except requests.RequestException as e:
-                        st.error(f"Error getting AI suggestion: {str(e)}")
-                st.rerun()
-
-            if st.session_state["ai_suggestion"]:
-                st.subheader("AI Suggestion")
-                st.write(st.session_state["ai_suggestion"])
-
-            if not st.session_state["similar_tickets_df"].empty:
-                st.subheader("Similar Tickets")
-                st.dataframe(
-                    st.session_state["similar_tickets_df"],
-                    use_container_width=True,
-                )
-
-            resolution = st.text_area("Resolution")
-            ai_helpful = st.checkbox("Was the AI suggestion helpful?")
-            feedback = st.text_area("Feedback on AI suggestion")
-            submit_resolution = st.form_submit_button("Resolve Ticket")
-
-            if submit_resolution:
-                with st.spinner("Resolving ticket..."):
-                    resolve_data = {
-                        "resolution": resolution,
-                        "ai_suggestion_helpful": ai_helpful,
-                        "feedback": feedback,
-                    }
-                    try:
-                        response = requests.post(
-                            f"{FASTAPI_URL}/resolve-ticket",
-                            params={
-                                "ticket_idx": st.session_state["current_index"]
-                            },
-                            json=resolve_data,
-                            timeout=TIMEOUT,
-                        )
-                        if response.status_code == 200:
-                            st.success("Ticket resolved successfully!")
-                            fetch_resolved_tickets()
-                            fetch_all_tickets()
-
-                            if st.session_state["current_index"] > 0:
-                                st.session_state["current_index"] -= 1
-                            fetch_ticket_by_idx(
-                                st.session_state["current_index"]
+                    # Rerun outside the status block so it stays in its
+                    # running state. This code is always part of the
+                    # render_ticket_panel fragment, so only the panel reruns
+                    # and clicks are never blocked on the request.
+                    if st.session_state["ai_suggestion_request"] is not None:
+                        st.rerun(scope="fragment")
+
+                if st.session_state["ai_suggestion"]:
+                    st.subheader("AI Suggestion")
+                    st.write(st.session_state["ai_suggestion"])
+
+                if not st.session_state["similar_tickets_df"].empty:
+                    st.subheader("Similar Tickets")
+                    st.dataframe(
+                        st.session_state["similar_tickets_df"],
+                        use_container_width=True,
+                    )
+
+                resolution = st.text_area("Resolution")
+                ai_helpful = st.checkbox("Was the AI suggestion helpful?")
+                feedback = st.text_area("Feedback on AI suggestion")
+                submit_resolution = st.form_submit_button("Resolve Ticket")
+
+                if submit_resolution:
+                    with st.spinner("Resolving ticket..."):
+                        resolve_data = {
+                            "resolution": resolution,
+                            "ai_suggestion_helpful": ai_helpful,
+                            "feedback": feedback,
+                        }
+                        try:
+                            response = _SESSION.post(
+                                f"{FASTAPI_URL}/resolve-ticket",
+                                params={
+                                    "ticket_idx": st.session_state[
+                                        "current_index"
+                                    ]
+                                },
+                                json=resolve_data,
+                                timeout=TIMEOUT,
                             )
-                            # Reset AI suggestion and similar tickets
-                            st.session_state["ai_suggestion"] = None
-                            st.session_state["similar_tickets_df"] = (
-                                pd.DataFrame()
+                            if response.status_code == 200:
+                                st.success("Ticket resolved successfully!")
+                                # Both lists changed, for every session
+                                _cached_get_json.clear()
+                                fetch_resolved_tickets()
+                                fetch_all_tickets()
+
+                                if st.session_state["current_index"] > 0:
+                                    st.session_state["current_index"] -= 1
+                                fetch_ticket_by_idx(
+                                    st.session_state["current_index"]
+                                )
+                                # Reset AI suggestion and similar tickets
+                                st.session_state["ai_suggestion_request"] = (
+                                    None
+                                )
+                                st.session_state["ai_suggestion"] = None
+                                st.session_state["similar_tickets_df"] = (
+                                    pd.DataFrame()
+                                )
+                                return True
+                            st.error(
+                                f"Failed to resolve ticket: {response.text}"
                             )
-                            return True
-                        st.error(f"Failed to resolve ticket: {response.text}")
 
-                    except requests.RequestException as e:
-                        st.error(f"Error resolving ticket: {str(e)}")
-        return False
+                        except requests.RequestException as e:
+                            st.error(f"Error resolving ticket: {str(e)}")
+            return False
+
+        # Resolving changes the resolved tickets table, so rerun the app
+        if create_resolution_form():
+            st.rerun()
 
-    if create_resolution_form():
-        st.rerun()
 
+render_ticket_panel()
 
 # Display resolved tickets
 st.header("Resolved Tickets")